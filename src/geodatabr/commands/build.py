@@ -8,6 +8,10 @@
 # Built-in dependencies
 
 import argparse
+import itertools
+import multiprocessing
+import os
+from concurrent import futures
 
 # Package dependencies
 
@@ -34,7 +38,7 @@ class BuildCommand(commands.Command):
     @property
     def usage(self) -> str:
         """Gets the command usage syntax."""
-        return '%(prog)s [-l LOCALE] [-f FORMAT]'
+        return '%(prog)s [-l LOCALE] [-f FORMAT] [-j JOBS]'
 
     def configure(self):
         """Defines the command arguments."""
@@ -57,6 +61,12 @@ class BuildCommand(commands.Command):
                          help=('File formats to build the dataset.\n'
                                'Options: %(choices)s\n'
                                'Defaults to all available.'))
+        self.addArgument('-j', '--jobs',
+                         metavar='JOBS',
+                         type=int,
+                         default=os.cpu_count(),
+                         help=('Number of dataset files to build at once.\n'
+                               'Defaults to the number of CPUs.'))
 
     def handle(self, args: argparse.Namespace):
         """
@@ -66,24 +76,32 @@ class BuildCommand(commands.Command):
             args: The command arguments
         """
         try:
-            encoder = encode.EncodeCommand(self.application)
             logger = logging.logger()
+            builds = list(itertools.product(args.locales, args.formats))
+            jobs = max(min(args.jobs or 1, len(builds)), 1)
+
+            logger.info('> Building locales: %s', ', '.join(args.locales))
+
+            # Each locale/format pair is encoded independently, so they can be
+            # spread across worker processes to not be bound by the GIL
+            if jobs > 1:
+                with futures.ProcessPoolExecutor(
+                        max_workers=jobs,
+                        mp_context=multiprocessing.get_context('spawn'),
+                        initializer=logging.Logger.setup,
+                        initargs=(args.verbose,)) as executor:
+                    for future in [executor.submit(encode_dataset, *build)
+                                   for build in builds]:
+                        future.result()
+            else:
+                for build in builds:
+                    encode_dataset(*build)
 
             for locale in args.locales:
                 i18n.Translator.locale = locale
-
-                logger.info('> Building locale: %s', locale)
-
                 dataset_dir = io.Directory(io.Path.DATA_DIR / locale)
-                dataset_dir.create(parents=True)
 
                 with dataset_dir:
-                    for dataset_format in args.formats:
-                        encoder.configure()
-                        encoder.handle(encoder.parse([
-                            '--format', dataset_format,
-                            '--locale', locale]))
-
                     logger.info('Generating dataset README file...')
 
                     documentation.DatasetReadme(dataset_dir).write()
@@ -95,3 +113,23 @@ class BuildCommand(commands.Command):
             self._parser.error('Failed to build dataset.')
         except KeyboardInterrupt:
             self._parser.terminate('Building was canceled.')
+
+# Functions
+
+
+def encode_dataset(locale: str, dataset_format: str):
+    """
+    Encodes the dataset into the given locale and file format.
+
+    It's a module-level function so it can be run on worker processes.
+
+    Args:
+        locale: The locale to encode the dataset
+        dataset_format: The file format to encode the dataset
+    """
+    # A new application is used since the encode command parser can only be
+    # registered once per application
+    command = encode.EncodeCommand(commands.Application())
+    command.configure()
+    command.handle(command.parse(['--format', dataset_format,
+                                  '--locale', locale]))
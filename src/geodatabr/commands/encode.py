@@ -11,7 +11,7 @@ import argparse
 
 # Package dependencies
 
-from geodatabr.core import commands, encoders, i18n, logging
+from geodatabr.core import commands, decorators, encoders, i18n, logging
 from geodatabr.core.utils import io
 from geodatabr.dataset import schema, serializers
 
@@ -59,6 +59,25 @@ class EncodeCommand(commands.Command):
                                'Options: %(choices)s\n'
                                'Default: All tables'))
 
+    @staticmethod
+    @decorators.cachedmethod()
+    def serializer(locale: str, **options) -> serializers.Serializer:
+        """
+        Returns the dataset serializer for the given locale and options.
+
+        The same serializer is handed to every encoder sharing them, so the
+        dataset is only serialized once when encoding it to several formats.
+
+        Args:
+            locale: The locale the dataset is serialized into
+            **options: The serialization options
+
+        Returns:
+            The dataset serializer instance
+        """
+        # pylint: disable=unused-argument
+        return serializers.Serializer(**options)
+
     def handle(self, args: argparse.Namespace):
         """
         Handles the command.
@@ -75,8 +94,11 @@ class EncodeCommand(commands.Command):
 
         try:
             encoder = encoders.EncoderFactory.fromFormat(args.format)
-            serializer = serializers.Serializer(**encoder.serializationOptions)
+            serializer = self.serializer(args.locale,
+                                         **encoder.serializationOptions)
             entity_map = dict(zip(schema.TABLES, schema.ENTITIES))
+            dataset = serializer.serialize(tuple(entity_map.get(table)
+                                                 for table in args.tables))
 
             logger.info('Encoding dataset to %s format...',
                         encoder.format.friendlyName)
@@ -86,11 +108,11 @@ class EncodeCommand(commands.Command):
 
             with dataset_dir:
                 if encoder.format.isFlatFile:
-                    for table in args.tables:
-                        table_name = i18n._(table)
-                        entity = (entity_map.get(table),)
+                    # Empty tables are left out by the serializer, so only
+                    # the populated ones are encoded
+                    for table_name, rows in dataset.items():
                         encoder.encodeToFile(
-                            serializer.serialize(entity).get(table_name),
+                            rows,
                             '{dataset_name}-{table_name}{extension}'.format(
                                 dataset_name=i18n._('dataset_name'),
                                 table_name=table_name,
@@ -99,8 +121,7 @@ class EncodeCommand(commands.Command):
                     return
 
                 encoder.encodeToFile(
-                    serializer.serialize(tuple(entity_map.get(table)
-                                               for table in args.tables)),
+                    dataset,
                     i18n._('dataset_name') + encoder.format.extension)
         except encoders.EncodeError:
             self._parser.error('Failed to encode dataset.')
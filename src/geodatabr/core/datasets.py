@@ -25,7 +25,7 @@ from sqlalchemy.sql import schema as db_schema
 
 # Package dependencies
 
-from geodatabr.core import decorators, i18n, types
+from geodatabr.core import decorators, types
 from geodatabr.core.utils import io
 
 # Classes
@@ -126,9 +126,9 @@ class Entity(db_declarative_api.declarative_base()):
 
     metadata = db_schema.MetaData(naming_convention=naming_convention)
 
-    def serialize(self, columns: list = None) -> types.OrderedMap:
+    def serialize(self, columns: list = None) -> dict:
         """
-        Serializes the entity to an ordered mapping.
+        Serializes the entity to a mapping.
 
         Args:
             columns: An optional list of column names to serialize
@@ -138,8 +138,9 @@ class Entity(db_declarative_api.declarative_base()):
         """
         columns = columns or [column.name for column in self.__table__.columns]
 
-        return types.OrderedMap((str(column), getattr(self, column))
-                                for column in columns)
+        # Plain dicts keep the insertion order, so there's no need to pay for
+        # an ordered mapping for every entity item
+        return {str(column): getattr(self, column) for column in columns}
 
 
 class Repository(types.AbstractClass):
@@ -184,6 +185,22 @@ class Repository(types.AbstractClass):
         """
         return types.List(cls.db.query(cls.entity).all())
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all entity items column values, loading them in batches.
+
+        Args:
+            batch_size: The number of entity items loaded at once
+
+        Yields:
+            The entity items column values tuples
+        """
+        # Columns are queried directly, so no entity instances are built just
+        # to read their values
+        yield from cls.db.query(*cls.entity.__table__.columns) \
+            .yield_per(batch_size)
+
     @classmethod
     def findByCriteria(cls, *criterias) -> types.List:
         """
@@ -276,66 +293,6 @@ class Seeder(types.AbstractClass):
         raise NotImplementedError
 
 
-class Serializer(object):
-    """Dataset serializer class."""
-
-    def __init__(self, **options):
-        """
-        Setup the serializer.
-
-        Args:
-            **options: The serialization options
-        """
-        self._options = types.OrderedMap(
-            # Whether or not it should localize mapping keys
-            localize=bool(options.get('localize', True)),
-            # Whether or not it should coerce mapping values to string
-            forceStr=bool(options.get('forceStr', False)),
-        )
-
-    @decorators.cachedmethod()
-    def serialize(self, entities: Iterator[Entity]) -> types.OrderedMap:
-        """
-        Serializes the dataset rows.
-
-        Args:
-            entities: The list of entities to serialize
-
-        Returns:
-            The serialized dataset rows mapping
-        """
-        rows = types.OrderedMap()
-
-        for entity in entities:
-            table_name = str(entity.__table__.name)
-            repository = RepositoryFactory.fromEntity(entity)
-            _rows = repository.findAll()
-
-            if not _rows:
-                continue
-
-            if self._options.localize:
-                table_name = i18n._(table_name)
-
-            rows[table_name] = types.List()
-
-            for _row in _rows:
-                row = types.OrderedMap()
-
-                for column, value in _row.serialize().items():
-                    if self._options.localize:
-                        column = i18n._(column)
-
-                    if self._options.forceStr or column == 'name':
-                        value = str(value)
-
-                    row[column] = value
-
-                rows[table_name].append(row)
-
-        return rows
-
-
 class RepositoryFactory(object):
     """Factory class for instantiation of concrete repositories."""
 
@@ -18,6 +18,42 @@ import functools
 # Classes
 
 
+class CachedProperty(object):
+    """
+    A read-only property computed once and then stored on the instance.
+
+    It's only used where functools.cached_property isn't available.
+    """
+
+    def __init__(self, func):
+        """
+        Creates a new cached property.
+
+        Args:
+            func: The property getter
+        """
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __get__(self, instance, owner=None):
+        """
+        Gets the property value, computing it on first access.
+
+        Args:
+            instance: The instance the property is read from
+            owner: The instance class
+
+        Returns:
+            The property value
+        """
+        if instance is None:
+            return self
+
+        value = instance.__dict__[self.func.__name__] = self.func(instance)
+
+        return value
+
+
 class DataDescriptor(type):
     """A data descriptor to allow declaring read-only class properties."""
 
@@ -69,6 +105,21 @@ def cachedmethod(maxsize: int = None):
     """
     return functools.lru_cache(maxsize=maxsize)
 
+def cachedproperty(func):
+    """
+    A cache decorator for memoizing read-only properties.
+
+    The value is stored on the instance itself, so it lives as long as the
+    instance does and further reads are plain attribute lookups.
+
+    Args:
+        func: The property getter to decorate
+
+    Returns:
+        The cached property
+    """
+    return getattr(functools, 'cached_property', CachedProperty)(func)
+
 def datadescriptor(cls):
     """
     A data descriptor decorator to allow declaring read-only class properties.
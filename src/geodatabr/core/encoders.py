@@ -12,7 +12,10 @@ This module provides the dataset encoders base functionality.
 # Built-in dependencies
 
 import abc
+import contextlib
 import itertools
+import operator
+import shutil
 
 # Package dependencies
 
@@ -182,13 +185,13 @@ class EncoderFormatRepository(object):
         return types.List([(format_type,
                             types.List(sorted(
                                 formats,
-                                key=lambda _format: _format.friendlyName)))
+                                key=operator.attrgetter('friendlyName'))))
                            for format_type, formats in itertools.groupby(
                                sorted([encoder.format()
                                        for encoder in Encoder.childs()
                                        if getattr(encoder, 'format')],
-                                      key=lambda _format: _format.type),
-                               key=lambda _format: _format.type)])
+                                      key=operator.attrgetter('type')),
+                               key=operator.attrgetter('type'))])
 
 
 class Encoder(types.AbstractClass):
@@ -255,8 +258,41 @@ class Encoder(types.AbstractClass):
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
-        with open(filename, 'wb') as output_file:
-            output_file.write(self.encode(data, **options).read())
+        # Writes to a temporary file first and then moves it into place, so an
+        # interrupted encoding never leaves a truncated file behind
+        temp_file = io.File(str(filename) + '.tmp')
+
+        try:
+            with temp_file.open(mode='wb') as output_file:
+                self._encodeToStream(data, output_file, **options)
+        except BaseException:
+            with contextlib.suppress(FileNotFoundError):
+                temp_file.unlink()
+
+            raise
+
+        temp_file.replace(filename)
+
+    def _encodeToStream(self, data, output_file, **options):
+        """
+        Encodes the data into the given binary file-like object.
+
+        Args:
+            data: The data to encode
+            output_file: The binary file-like object to write
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        with self.encode(data, **options) as stream:
+            # In-memory streams are written at once from their buffer, with
+            # no intermediate copies
+            if isinstance(stream, io.BinaryFileStream):
+                with stream.getbuffer() as buffer:
+                    output_file.write(buffer)
+            else:
+                shutil.copyfileobj(stream, output_file)
 
 
 class EncoderFactory(object):
@@ -22,6 +22,12 @@ import yaml
 from geodatabr.core import decorators, types
 from geodatabr.core.utils import io
 
+# Constants
+
+# Uses the LibYAML based loader when available, falling back to the pure
+# Python one otherwise
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 # Classes
 
 
@@ -43,7 +49,8 @@ class Localization(object):
         self._locale = locale
 
         try:
-            self._translations = types.Map(yaml.load(locale_file.read()))
+            self._translations = types.Map(
+                yaml.load(locale_file.read(), Loader=YAML_LOADER))
         except Exception:
             raise UnsupportedLocaleFileError('Unsupported localization file')
 
@@ -77,7 +84,9 @@ class Localization(object):
 
             return translation
 
-        return message
+        # Coerces str subclasses (e.g. SQLAlchemy quoted names) since the
+        # cached result is shared by every equal message
+        return str(message)
 
     def __repr__(self) -> str:
         """
@@ -114,12 +123,12 @@ class Translator(object):
         Returns:
             The available localizations mapping
         """
-        return types.Map({locale: Localization(locale, locale_file)
-                          for locale, locale_file in map(
-                              lambda locale_file: (locale_file.basename,
-                                                   locale_file),
-                              io.Directory(io.Path.PKG_TRANSLATION_DIR)
-                              .files(pattern='*.yaml'))})
+        locale_files = io.Directory(io.Path.PKG_TRANSLATION_DIR) \
+            .files(pattern='*.yaml')
+
+        return types.Map({locale_file.basename:
+                          Localization(locale_file.basename, locale_file)
+                          for locale_file in locale_files})
 
     @classmethod
     def translate(cls, message: str, **placeholders) -> str:
@@ -130,13 +139,32 @@ class Translator(object):
             message: The message to be translated
             **placeholders: Any translation placeholder
 
+        Returns:
+            The translated message
+        """
+        return cls._translate(cls.locale, str(message), **placeholders)
+
+    @classmethod
+    @decorators.cachedmethod()
+    def _translate(cls, locale: str, message: str, **placeholders) -> str:
+        """
+        Translates the given message with their placeholders.
+
+        The translations are cached by locale and message, so each distinct
+        message is only looked up once per locale.
+
+        Args:
+            locale: The locale to translate the message into
+            message: The message to be translated
+            **placeholders: Any translation placeholder
+
         Returns:
             The translated message
         """
         locales = cls.locales()
 
-        if cls.locale in locales:
-            return locales[cls.locale].translate(message, **placeholders)
+        if locale in locales:
+            return locales[locale].translate(message, **placeholders)
 
         # Try using the fallback locale
         if cls.fallbackLocale in locales:
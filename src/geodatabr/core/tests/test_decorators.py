@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Core decorators testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Built-in dependencies
+
+import functools
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import decorators
+
+# Constants
+
+# The cached property decorators along with the descriptor type they produce
+CACHED_PROPERTIES = [
+    (decorators.cachedproperty,
+     getattr(functools, 'cached_property', decorators.CachedProperty)),
+    (decorators.CachedProperty, decorators.CachedProperty),
+]
+
+# Classes
+
+
+class TestCachedProperty(object):
+    """Tests cached property decorators."""
+
+    @pytest.mark.parametrize('cachedproperty, _descriptor', CACHED_PROPERTIES)
+    def testComputedOnce(self, cachedproperty, _descriptor):
+        """Tests if cached properties are only computed once per instance."""
+        # pylint: disable=missing-docstring
+        class Foo(object):
+            calls = 0
+
+            @cachedproperty
+            def bar(self):
+                """Gets the bar."""
+                Foo.calls += 1
+
+                return [Foo.calls]
+
+        foo = Foo()
+
+        assert foo.bar == [1]
+        assert foo.bar is foo.bar
+        assert Foo().bar == [2]
+        assert Foo.calls == 2
+
+    @pytest.mark.parametrize('cachedproperty, descriptor', CACHED_PROPERTIES)
+    def testClassAccess(self, cachedproperty, descriptor):
+        """Tests if cached properties return the descriptor from the class."""
+        # pylint: disable=missing-docstring
+        class Foo(object):
+            @cachedproperty
+            def bar(self):
+                """Gets the bar."""
+                return 1
+
+        # pylint: disable=unidiomatic-typecheck
+        assert type(Foo.bar) is descriptor
+        assert Foo.bar.__doc__ == 'Gets the bar.'
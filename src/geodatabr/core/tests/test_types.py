@@ -317,6 +317,14 @@ class TestList(object):
         assert len(unique_numbers) == 4
         assert unique_numbers == [0, 1, 2, 3]
 
+    def testUniqueOrder(self):
+        """Tests if List.unique() keeps the first occurrences order."""
+        items = types.List([3, 1, 'b', 3, 'a', 1, 'b', 2, 'a'])
+        unique_items = items.unique()
+
+        assert isinstance(unique_items, types.List)
+        assert unique_items == [3, 1, 'b', 'a', 2]
+
 
 class TestMap(object):
     """Tests Map type methods."""
@@ -338,6 +346,18 @@ class TestMap(object):
 
         assert coords.x == 0 and coords.y == 1
 
+    def testSlots(self):
+        """Tests if Map attributes are kept as keys, without a __dict__."""
+        coords = types.Map()
+        coords.x = 0
+        ordered_coords = types.OrderedMap()
+        ordered_coords.x = 0
+
+        assert not hasattr(coords, '__dict__')
+        assert coords == {'x': 0}
+        assert ordered_coords == {'x': 0}
+        assert not hasattr(types.List(), '__dict__')
+
     def testAttributeDeletion(self):
         """Tests if Map.__delattr__() works as expected."""
         coords = types.Map(x=0, y=1)
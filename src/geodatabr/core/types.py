@@ -220,6 +220,10 @@ class Bytes(io.BytesIO):
 class List(list):
     """An improved list type with super powers."""
 
+    # No instance attributes are ever set, so there's no need for a per-list
+    # attribute dictionary
+    __slots__ = ()
+
     def chunk(self, size: int) -> 'List':
         """
         Returns a new list chunked into multiple lists of the given size.
@@ -603,7 +607,9 @@ class List(list):
         Returns:
             A list of unique items
         """
-        return List(sorted(set(self), key=self.index))
+        # Dictionary keys keep the first occurrence order, which avoids
+        # looking each item up again to sort them back into place
+        return List(dict.fromkeys(self))
 
     def __repr__(self) -> str:
         """
@@ -625,6 +631,10 @@ class List(list):
 class Map(dict):
     """An improved dictionary type with attribute-style access."""
 
+    # Attributes are mapping keys, so there's no need for a per-mapping
+    # attribute dictionary
+    __slots__ = ()
+
     def __getattr__(self, key: Any) -> Any:
         """
         Allows accessing keys as attributes.
@@ -12,6 +12,7 @@ This module provides helper classes to write documentation files.
 # Built-in dependencies
 
 import itertools
+import operator
 
 # Package dependencies
 
@@ -172,8 +173,8 @@ class DatasetReadme(Readme):
         files = list(self._dataset_dir.files(
             pattern=i18n._('dataset_name') + '*'))
         grouped_files = itertools.groupby(
-            sorted(files, key=lambda file: file.format.type),
-            key=lambda file: file.format.type)
+            sorted(files, key=operator.attrgetter('format.type')),
+            key=operator.attrgetter('format.type'))
         listing = []
 
         for dataset_type, dataset_files in grouped_files:
@@ -20,6 +20,10 @@ import uuid
 from typing import Iterator
 import pkg_resources
 
+# Package dependencies
+
+from geodatabr.core import decorators
+
 # Classes
 
 
@@ -280,7 +284,7 @@ class File(Path):
 
     # Properties
 
-    @property
+    @decorators.cachedproperty
     def format(self):
         """Gets the file format."""
         from geodatabr.core.encoders import \
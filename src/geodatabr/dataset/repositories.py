@@ -9,6 +9,10 @@ This module provides the repositories classes used to query the datasets.
 """
 # Imports
 
+# Built-in dependencies
+
+from typing import Iterator
+
 # External dependencies
 
 from sqlalchemy import orm
@@ -61,6 +65,19 @@ class StateRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all states column values, loading them in batches.
+
+        Args:
+            batch_size: The number of states loaded at once
+
+        Yields:
+            The states column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def loadAll(cls) -> types.List:
         """
@@ -153,6 +170,19 @@ class MesoregionRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all mesoregions column values, loading them in batches.
+
+        Args:
+            batch_size: The number of mesoregions loaded at once
+
+        Yields:
+            The mesoregions column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def loadAll(cls) -> types.List:
         """
@@ -244,6 +274,19 @@ class MicroregionRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all microregions column values, loading them in batches.
+
+        Args:
+            batch_size: The number of microregions loaded at once
+
+        Yields:
+            The microregions column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def loadAll(cls) -> types.List:
         """
@@ -334,6 +377,19 @@ class MunicipalityRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all municipalities column values, loading them in batches.
+
+        Args:
+            batch_size: The number of municipalities loaded at once
+
+        Yields:
+            The municipalities column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def loadAll(cls) -> types.List:
         """
@@ -423,6 +479,19 @@ class DistrictRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all districts column values, loading them in batches.
+
+        Args:
+            batch_size: The number of districts loaded at once
+
+        Yields:
+            The districts column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def loadAll(cls) -> types.List:
         """
@@ -510,6 +579,19 @@ class SubdistrictRepository(datasets.Repository):
         """
         return super().findAll()
 
+    @classmethod
+    def iterValues(cls, batch_size: int = 1000) -> Iterator[tuple]:
+        """
+        Iterates over all subdistricts column values, loading them in batches.
+
+        Args:
+            batch_size: The number of subdistricts loaded at once
+
+        Yields:
+            The subdistricts column values tuples
+        """
+        yield from super().iterValues(batch_size)
+
     @classmethod
     def findById(cls, _id: int) -> schema.Subdistrict:
         """
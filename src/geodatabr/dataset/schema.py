@@ -261,3 +261,6 @@ class Subdistrict(datasets.Entity):
 
 ENTITIES = (State, Mesoregion, Microregion, Municipality, District, Subdistrict)
 TABLES = tuple(entity.__table__.name for entity in ENTITIES)
+COLUMNS = {entity.__table__.name: tuple(str(column.name)
+                                        for column in entity.__table__.columns)
+           for entity in ENTITIES}
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""
+Datasets serializers module.
+
+This module provides the serializer classes used to serialize the datasets.
+"""
+# Imports
+
+# Built-in dependencies
+
+import contextlib
+import hashlib
+import os
+import pickle
+import tempfile
+from typing import Iterator, Tuple
+
+# Package dependencies
+
+from geodatabr import __meta__
+from geodatabr.core import datasets, decorators, i18n, logging, types
+from geodatabr.core.utils import io
+from geodatabr.dataset import repositories, schema  # pylint: disable=unused-import
+
+# Constants
+
+# The serialized rows cache format, which must be bumped whenever the way rows
+# are serialized changes, so that older cache files are never loaded
+CACHE_FORMAT = 1
+
+# Classes
+
+
+class Serializer(object):
+    """Dataset serializer class."""
+
+    def __init__(self, **options):
+        """
+        Setup the serializer.
+
+        Args:
+            **options: The serialization options
+        """
+        self._options = types.OrderedMap(
+            # Whether or not it should localize mapping keys
+            localize=bool(options.get('localize', True)),
+            # Whether or not it should coerce mapping values to string
+            forceStr=bool(options.get('forceStr', False)),
+            # Whether or not it should cache the serialized rows on disk
+            cache=bool(options.get('cache', True)),
+        )
+
+    def _serializeEntity(self,
+                         entity: datasets.Entity) -> Tuple[str, list]:
+        """
+        Serializes the rows of the given entity.
+
+        Args:
+            entity: The entity to serialize
+
+        Returns:
+            The serialized table name and rows list
+        """
+        localize = self._options.localize
+        force_str = self._options.forceStr
+        table_name = str(entity.__table__.name)
+        repository = datasets.RepositoryFactory.fromEntity(entity)
+        # Column values are streamed from the database in batches, so neither
+        # the entity items are all loaded at once nor built at all
+        _rows = repository.iterValues()
+
+        if localize:
+            table_name = i18n._(table_name)
+
+        columns = schema.COLUMNS[entity.__table__.name]
+        keys = [i18n._(column) for column in columns] if localize else columns
+
+        # Rows are built as plain lists and dicts, which are cheaper to create
+        # than their wrapper types and still keep the insertion order. The
+        # options are checked once here rather than once per row.
+        if force_str:
+            return table_name, [dict(zip(keys, map(str, values)))
+                                for values in _rows]
+
+        return table_name, [dict(zip(keys, values)) for values in _rows]
+
+    def _cacheFile(self, entities: Tuple[datasets.Entity]) -> io.File:
+        """
+        Returns the cache file of the given entities serialized rows.
+
+        Args:
+            entities: The list of entities to serialize
+
+        Returns:
+            The cache file instance
+        """
+        options = tuple((name, value)
+                        for name, value in self._options.items()
+                        if name != 'cache')
+        # The rows hold translated table and column names, so the loaded
+        # translations are part of the key as well
+        locales = i18n.Translator.locales()
+        localization = (locales.get(i18n.Translator.locale)
+                        or locales.get(i18n.Translator.fallbackLocale))
+        translations = (sorted(localization.translations.items())
+                        if localization else None)
+        tables = tuple((str(entity.__table__.name),
+                        schema.COLUMNS[entity.__table__.name])
+                       for entity in entities)
+        key = repr((CACHE_FORMAT, __meta__.__version__,
+                    i18n.Translator.locale, translations, options, tables))
+
+        return io.CacheFile('serializer-{}.pickle'.format(
+            hashlib.sha1(key.encode()).hexdigest()))
+
+    def _serializeEntities(self,
+                           entities: Tuple[datasets.Entity]) -> types.OrderedMap:
+        """
+        Serializes the rows of the given entities.
+
+        Args:
+            entities: The list of entities to serialize
+
+        Returns:
+            The serialized dataset rows mapping
+        """
+        tables = map(self._serializeEntity, entities)
+
+        return types.OrderedMap((table_name, rows)
+                                for table_name, rows in tables
+                                if rows)
+
+    @decorators.cachedmethod()
+    def serialize(self,
+                  entities: Iterator[datasets.Entity] = None) -> types.OrderedMap:
+        """
+        Serializes the dataset rows.
+
+        Args:
+            entities: The list of entities to serialize (defaults to all)
+
+        Returns:
+            The serialized dataset rows mapping
+        """
+        entities = tuple(entities or schema.ENTITIES)
+
+        if not self._options.cache:
+            return self._serializeEntities(entities)
+
+        # The serialized rows are kept on disk between runs, stamped with the
+        # database file state so they're rebuilt whenever it changes
+        database_file = io.CacheFile('geodatabr.db')
+        stamp = (database_file.mtime, database_file.size)
+        cache_file = self._cacheFile(entities)
+
+        try:
+            cached_stamp, rows = pickle.loads(cache_file.readBytes())
+
+            if cached_stamp == stamp:
+                return rows
+        except FileNotFoundError:
+            pass
+        except Exception:  # pylint: disable=broad-except
+            logging.logger().debug('Ignoring unreadable cache file: %s',
+                                   cache_file)
+
+        rows = self._serializeEntities(entities)
+
+        # Every writer gets its own temporary file, since several processes
+        # may be serializing the same rows at once, then the last one to
+        # finish replaces the cache file
+        temp_name = None
+
+        try:
+            temp_fd, temp_name = tempfile.mkstemp(
+                prefix=cache_file.name + '.',
+                suffix='.tmp',
+                dir=str(io.Path.CACHE_DIR))
+
+            with os.fdopen(temp_fd, 'wb') as temp_file:
+                pickle.dump((stamp, rows), temp_file,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(temp_name, str(cache_file))
+        except OSError as error:
+            if temp_name:
+                with contextlib.suppress(FileNotFoundError):
+                    os.unlink(temp_name)
+
+            logging.logger().warning('Failed to write cache file %s: %s',
+                                     cache_file, error)
+
+        return rows
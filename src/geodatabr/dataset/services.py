@@ -233,7 +233,9 @@ class SidraDatasetResponse(list):
         Args:
             data: The API JSON response
         """
+        # Coerces the values once here, so the entity columns are always
+        # populated with integer IDs and string names
         super().__init__([
-            types.Map(id=_id, name=name)
+            types.Map(id=int(_id), name=str(name))
             for (_id, name) in zip(data['Codigos'], data['Nomes'])
         ])
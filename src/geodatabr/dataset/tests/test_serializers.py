@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""Dataset serializers testing module."""
+# pylint: disable=no-self-use, protected-access, redefined-outer-name
+
+# Imports
+
+# Built-in dependencies
+
+import os
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import i18n, types
+from geodatabr.core.utils import io
+from geodatabr.dataset import schema, serializers
+
+# Functions
+
+
+@pytest.fixture
+def serializer(monkeypatch, tmp_path):
+    """
+    Provides a disk cached serializer counting its serializations.
+
+    The cache directory is moved into a temporary one holding a stand-in
+    database file, and the serialized rows are stubbed out.
+    """
+    monkeypatch.setattr(io.Path, 'CACHE_DIR', tmp_path)
+    (tmp_path / 'geodatabr.db').write_bytes(b'database')
+
+    serializer = serializers.Serializer()
+    serializer.calls = 0
+
+    def _serializeEntities(entities):
+        serializer.calls += 1
+
+        return types.OrderedMap(
+            (i18n._(str(entity.__table__.name)), [serializer.calls])
+            for entity in entities)
+
+    monkeypatch.setattr(serializer, '_serializeEntities', _serializeEntities)
+
+    return serializer
+
+
+def serialize(serializer):
+    """
+    Serializes the dataset rows skipping the in-memory cache.
+
+    Args:
+        serializer: The serializer instance
+
+    Returns:
+        The serialized dataset rows mapping
+    """
+    return serializers.Serializer.serialize.__wrapped__(serializer,
+                                                        schema.ENTITIES)
+
+# Classes
+
+
+class TestSerializer(object):
+    """Tests Serializer disk cache."""
+
+    def testCacheHit(self, serializer):
+        """Tests if serialized rows are loaded back from the cache file."""
+        assert serialize(serializer) == serialize(serializer)
+        assert serializer.calls == 1
+        assert not list(io.Path.CACHE_DIR.glob('*.tmp'))
+
+    def testCacheDatabaseChange(self, serializer):
+        """Tests if a database file change invalidates the cache."""
+        serialize(serializer)
+        database_file = io.CacheFile('geodatabr.db')
+        database_file.write_bytes(b'changed database')
+        stat = database_file.stat()
+        os.utime(str(database_file), (stat.st_atime, stat.st_mtime + 1))
+        serialize(serializer)
+
+        assert serializer.calls == 2
+
+    def testCacheTranslationChange(self, serializer, monkeypatch):
+        """Tests if a translations change invalidates the cache."""
+        serialize(serializer)
+        localization = i18n.Translator.locales()[i18n.Translator.locale]
+        translations = types.Map(localization.translations,
+                                 states='XX_states')
+        monkeypatch.setattr(localization, '_translations', translations)
+        serialize(serializer)
+
+        assert serializer.calls == 2
+
+    def testCacheCorruption(self, serializer):
+        """Tests if an unreadable cache file is rebuilt."""
+        serialize(serializer)
+        serializer._cacheFile(schema.ENTITIES).write_bytes(b'corrupted')
+
+        assert serialize(serializer) == types.OrderedMap(
+            (i18n._(str(entity.__table__.name)), [2])
+            for entity in schema.ENTITIES)
@@ -7,11 +7,20 @@
 
 # Built-in dependencies
 
+import itertools
 import json
+from typing import Iterator, Optional
+
+# External dependencies
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Package dependencies
 
-from geodatabr.core import encoders
+from geodatabr.core import decorators, encoders
 from geodatabr.core.utils import io
 
 # Classes
@@ -68,6 +77,126 @@ class JsonEncoder(encoders.Encoder):
                     separators=(',', ': '),
                     ensure_ascii=False)
 
+    @staticmethod
+    def _getOrjsonOption(options: dict) -> Optional[int]:
+        """
+        Returns the orjson option which reproduces the given encoding options.
+
+        Args:
+            options: The encoding options
+
+        Returns:
+            The orjson option, or None if orjson can't reproduce the options
+        """
+        if (not orjson
+                or options.get('ensure_ascii', True)
+                or set(options) - {'indent', 'separators', 'ensure_ascii'}):
+            return None
+
+        return {(2, (',', ': ')): orjson.OPT_INDENT_2,
+                (None, (',', ':')): 0}.get(
+                    (options.get('indent'),
+                     tuple(options.get('separators') or ())))
+
+    @staticmethod
+    def _hasFloats(data) -> bool:
+        """
+        Tells whether the given data holds any float value.
+
+        Args:
+            data: The data to check
+
+        Returns:
+            Whether the data holds any float value or not
+        """
+        containers = (dict, list, tuple)
+        values = [data]
+
+        # Checks one nesting level at a time, so the value types of a whole
+        # level are collected at once rather than value by value
+        while values:
+            value_types = set(map(type, values))
+
+            if any(issubclass(value_type, float)
+                   for value_type in value_types):
+                return True
+
+            if not any(issubclass(value_type, containers)
+                       for value_type in value_types):
+                return False
+
+            values = list(itertools.chain.from_iterable(
+                value.values() if isinstance(value, dict) else value
+                for value in values
+                if isinstance(value, containers)))
+
+        return False
+
+    @staticmethod
+    @decorators.cachedmethod()
+    def _getJsonEncoder(**options) -> json.JSONEncoder:
+        """
+        Returns the stdlib JSON encoder for the given encoding options.
+
+        Encoders hold no state between encodings, so the same instance is
+        reused by every encoding sharing the options.
+
+        Args:
+            **options: The encoding options
+
+        Returns:
+            The JSON encoder instance
+        """
+        return json.JSONEncoder(**options)
+
+    def _iterEncode(self, data: dict, **options) -> Iterator[bytes]:
+        """
+        Encodes the data into JSON chunks.
+
+        Args:
+            data: The data to encode
+            **options: The encoding options
+
+        Yields:
+            The JSON document chunks
+        """
+        options = dict(self.options, **options)
+        orjson_option = self._getOrjsonOption(options)
+
+        # orjson formats floats unlike the stdlib, e.g. NaN as null and 1e16
+        # without the exponent sign, so they're left to the stdlib encoder
+        # for the output not to depend on whether orjson is installed
+        if orjson_option is not None and not self._hasFloats(data):
+            try:
+                yield orjson.dumps(data, option=orjson_option)
+
+                return
+            except orjson.JSONEncodeError:
+                # Falls back to the stdlib encoder on values orjson doesn't
+                # support, such as integers over 64 bits
+                pass
+
+        try:
+            json_encoder = self._getJsonEncoder(**options)
+        except TypeError:
+            # Unhashable options can't be cached, e.g. separators as a list
+            json_encoder = json.JSONEncoder(**options)
+
+        # Unindented documents are encoded at once, since only then the C
+        # accelerated encoder is used, which outweighs streaming them
+        if options.get('indent') is None:
+            yield json_encoder.encode(data).encode('utf-8')
+
+            return
+
+        json_chunks = json_encoder.iterencode(data)
+
+        # Yields the document in batches of chunks, so it's never held as a
+        # whole string without paying for one write per token either
+        for json_data in iter(
+                lambda: ''.join(itertools.islice(json_chunks, 1024)), ''):
+            yield json_data.encode('utf-8')
+
     def encode(self, data: dict, **options) -> io.BinaryFileStream:
         """
         Encodes the data into a JSON file-like stream.
@@ -83,8 +212,34 @@ class JsonEncoder(encoders.Encoder):
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
         try:
-            return io.BinaryFileStream(
-                json.dumps(data, **dict(self.options, **options))
-                .encode('utf-8'))
+            json_file = io.BinaryFileStream()
+
+            for json_data in self._iterEncode(data, **options):
+                json_file.write(json_data)
+
+            json_file.seek(0)
+
+            return json_file
+        except Exception:
+            raise encoders.EncodeError
+
+    def _encodeToStream(self, data: dict, output_file, **options):
+        """
+        Encodes the data into the given binary file-like object.
+
+        The JSON chunks are written straight into it, so the document is never
+        held as a whole in memory.
+
+        Args:
+            data: The data to encode
+            output_file: The binary file-like object to write
+            **options: The encoding options
+
+        Raises:
+            geodatabr.core.encoders.EncodeError: If data fails to encode
+        """
+        try:
+            for json_data in self._iterEncode(data, **options):
+                output_file.write(json_data)
         except Exception:
             raise encoders.EncodeError
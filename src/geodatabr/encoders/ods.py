@@ -86,7 +86,7 @@ class OpenDocumentSpreadsheetEncoder(encoders.Encoder):
             ods_data = types.OrderedMap()
 
             for entity, records in data.items():
-                ods_data[entity] = [list(records.first().keys())] \
+                ods_data[entity] = [list(records[0].keys())] \
                     + [list(record.values()) for record in records]
 
             pyexcel_ods.save_data(ods_file, ods_data)
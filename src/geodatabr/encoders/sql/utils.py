@@ -7,13 +7,14 @@
 
 # Built-in dependencies
 
-from typing import Any
+import itertools
+from typing import Any, Callable
 
 # External dependencies
 
 from sqlalchemy import dialects
 from sqlalchemy.engine import default, interfaces
-from sqlalchemy.sql import schema
+from sqlalchemy.sql import schema, sqltypes
 
 # Package dependencies
 
@@ -50,6 +51,34 @@ class Compiler(types.AbstractClass):
         """
         raise NotImplementedError
 
+    def literalProcessor(self, column: schema.Column) -> Callable:
+        """
+        Returns the literal processor used to render the given column values.
+
+        String values are only escaped when they contain a character that may
+        need it, which is rarely the case, otherwise they're just quoted.
+
+        Args:
+            column: The column element
+
+        Returns:
+            The column literal processor
+        """
+        processor = column.type.literal_processor(dialect=self.dialect)
+
+        # Falls back to the dialect processor if it does more than quoting
+        if (not isinstance(column.type, sqltypes.String)
+                or processor('') != "''"):
+            return processor
+
+        def _process_literal(value):
+            if "'" in value or '%' in value or '\\' in value:
+                return processor(value)
+
+            return "'" + value + "'"
+
+        return _process_literal
+
     def __str__(self) -> str:
         """
         Returns the compiled SQL statements.
@@ -75,7 +104,6 @@ class Column(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statement for the table column element.
@@ -115,7 +143,6 @@ class ColumnCollection(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statements for the table columns.
@@ -216,7 +243,6 @@ class Constraint(Compiler):
 
         return ddl
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statement for the table constraint element.
@@ -260,7 +286,6 @@ class ConstraintCollection(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statements for the table constraints.
@@ -305,7 +330,6 @@ class Index(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statement for the table index element.
@@ -345,7 +369,6 @@ class IndexCollection(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DDL statements for the table indexes.
@@ -353,15 +376,20 @@ class IndexCollection(Compiler):
         Returns:
             The compiled DDL statements for the table indexes
         """
-        # pylint: disable=protected-access
         if not self.table.indexes:
             return ''
 
+        # Workaround to render table indexes in the order they were declared
+        indexes = [index
+                   for column in self.table.columns
+                   for index in self.table.indexes
+                   if column in iter(index.columns)]
+
         return '\n\n--\n-- Indexes for table "{table}"\n--\n\n{indexes}' \
             .format(table=i18n._(self.table.name),
                     indexes='\n'.join(
                         str(Index(index, dialect=self.dialect.name))
-                        for index in self.table._sorted_indexes))
+                        for index in indexes))
 
 
 class Row(Compiler):
@@ -384,7 +412,6 @@ class Row(Compiler):
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DML statement for the table row.
@@ -392,11 +419,12 @@ class Row(Compiler):
         Returns:
             The compiled DML statement for the table row
         """
+        processors = {column.name: self.literalProcessor(column)
+                      for column in self.table.columns}
+
         def _compile_literals(row):
-            return ', '.join(
-                self.table.columns.get(column).type.literal_processor(
-                    dialect=self.dialect)(value)
-                for column, value in row.items())
+            return ', '.join(processors[column](value)
+                             for column, value in row.items())
 
         if (any(isinstance(self.row, _type) for _type in (list, set, tuple))
                 and self.dialect.supports_multivalues_insert):
@@ -413,19 +441,23 @@ class Row(Compiler):
 class RowCollection(Compiler):
     """SQL compiler class used to compile the rows of a given table."""
 
-    def __init__(self, table: schema.Table, dialect: str = None):
+    def __init__(self,
+                 table: schema.Table,
+                 rows: types.List = None,
+                 dialect: str = None):
         """
         Creates a new table row collection compiler instance.
 
         Args:
             table: The table element to compile
+            rows: The table rows list
             dialect: The SQL dialect name to use
         """
         self.table = table
+        self.rows = rows or types.List()
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the DML statements for the table rows.
@@ -433,58 +465,102 @@ class RowCollection(Compiler):
         Returns:
             The compiled DML statements for the table rows
         """
-        if not self.table.rows:
+        if not self.rows:
             return ''
 
-        return '\n\n--\n-- Data for table "{table}"\n--\n\n{rows}'.format(
-            table=i18n._(self.table.name),
-            rows='\n'.join(str(Row(self.table,
-                                   row,
-                                   dialect=self.dialect.name))
-                           for row in self.table.rows))
+        # The INSERT template and the column literal processors are the same
+        # for every row, so they're resolved only once per table
+        insert = 'INSERT INTO {table} VALUES (%s);'.format(
+            table=i18n._(self.table.name))
+        processors = {column.name: self.literalProcessor(column)
+                      for column in self.table.columns}
+
+        # Rows share the same columns order, so the processors are lined up
+        # with the row values once instead of being looked up by name
+        processors = [processors[column] for column in self.rows[0]]
+
+        # Joins the header and all rows at once to avoid copying the rows
+        # payload into intermediate strings
+        return '\n'.join(itertools.chain(
+            ('\n\n--\n-- Data for table "{table}"\n--\n'
+             .format(table=i18n._(self.table.name)),),
+            (insert % ', '.join([process(value)
+                                 for process, value in zip(processors,
+                                                           row.values())])
+             for row in self.rows)))
 
 
 class Table(Compiler):
     """SQL compiler class used to compile tables."""
 
-    def __init__(self, table: schema.Table, dialect: str = None):
+    def __init__(self,
+                 table: schema.Table,
+                 rows: types.List = None,
+                 dialect: str = None):
         """
         Creates a new table compiler instance.
 
         Args:
             table: The table element to compile
+            rows: The table rows list
             dialect: The SQL dialect name to use
         """
         self.table = table
+        self.rows = rows or types.List()
 
         super().__init__(dialect)
 
-    @decorators.cachedmethod()
-    def compile(self) -> str:
+    def compileDefinition(self) -> str:
         """
-        Compiles the DDL/DML statements for the table.
+        Compiles the DDL statement creating the table.
 
         Returns:
-            The compiled DDL/DML statements for the table
+            The compiled DDL statement creating the table
         """
-        ddl = '--\n-- Structure for table "{table}"\n--\n\n' \
-              'CREATE TABLE {table} (\n{columns}' \
-              .format(table=i18n._(self.table.name),
-                      columns=ColumnCollection(self.table,
-                                               dialect=self.dialect.name))
+        ddl = ['--\n-- Structure for table "{table}"\n--\n\n'
+               'CREATE TABLE {table} (\n{columns}'
+               .format(table=i18n._(self.table.name),
+                       columns=ColumnCollection(self.table,
+                                                dialect=self.dialect.name))]
 
         if self.table.constraints:
-            ddl += ',\n  ' + str(ConstraintCollection(
+            ddl.append(',\n  ' + str(ConstraintCollection(
                 self.table,
-                dialect=self.dialect.name))
+                dialect=self.dialect.name)))
 
-        return ddl + '\n);{rows}{constraints}{indexes}'.format(
-            rows=str(RowCollection(self.table, dialect=self.dialect.name)),
-            constraints=str(ConstraintCollection(self.table,
+        ddl.append('\n);')
+
+        return ''.join(ddl)
+
+    def compileIndexes(self) -> str:
+        """
+        Compiles the DDL statements for the out-of-line constraints and the
+        indexes of the table.
+
+        They're meant to run after the table rows are inserted, so the indexes
+        are built at once rather than updated on every insert.
+
+        Returns:
+            The compiled DDL statements for the table constraints and indexes
+        """
+        return ''.join([str(ConstraintCollection(self.table,
                                                  use_alter=True,
                                                  dialect=self.dialect.name)),
-            indexes=str(IndexCollection(self.table,
-                                        dialect=self.dialect.name)))
+                        str(IndexCollection(self.table,
+                                            dialect=self.dialect.name))])
+
+    def compile(self) -> str:
+        """
+        Compiles the DDL/DML statements for the table.
+
+        Returns:
+            The compiled DDL/DML statements for the table
+        """
+        return ''.join([self.compileDefinition(),
+                        str(RowCollection(self.table,
+                                          self.rows,
+                                          dialect=self.dialect.name)),
+                        self.compileIndexes()])
 
 
 class Schema(Compiler):
@@ -501,26 +577,18 @@ class Schema(Compiler):
 
         super().__init__(dialect)
 
-    def addTable(self, table: schema.Table, rows: types.List):
+    def addTable(self, table: schema.Table, rows: types.List = None):
         """
         Add the given table to schema.
 
         Args:
             table: The Table instance to add
-            rows: The table rows list
+            rows: The optional table rows list
         """
-        # pylint: disable=protected-access
-        table.rows = rows
-
-        # Workaround to render table indexes in the order they were declared
-        table._sorted_indexes = types.List([index
-                                            for column in table.columns
-                                            for index in table.indexes
-                                            if column in iter(index.columns)])
-
-        self.tables.append(table)
+        # The rows are kept by the schema rather than set on the table, since
+        # table elements are shared module-level objects
+        self.tables.append((table, rows))
 
-    @decorators.cachedmethod()
     def compile(self) -> str:
         """
         Compiles the SQL statements for the schema
@@ -528,18 +596,22 @@ class Schema(Compiler):
         Returns:
             The compiled SQL statements for the schema
         """
-        return '\n\n'.join([str(Table(table, dialect=self.dialect.name))
-                            for table in self.tables])
+        return '\n\n'.join([str(Table(table, rows, dialect=self.dialect.name))
+                            for table, rows in self.tables])
 
 
 class Dialect(object):
     """Utility class for retrieval of SQL dialect implementations."""
 
     @staticmethod
+    @decorators.cachedmethod()
     def factory(dialect: str) -> interfaces.Dialect:
         """
         Factories the given SQL dialect instance by name.
 
+        Every compiler asks for its dialect, so a single instance is shared per
+        dialect name instead of loading a new one each time.
+
         Args:
             dialect: The SQL dialect name
 
@@ -556,6 +628,7 @@ class Dialect(object):
         raise UnsupportedDialectError('Unsupported dialect: {}'.format(dialect))
 
     @staticmethod
+    @decorators.cachedmethod()
     def getNamingConvention(dialect: interfaces.Dialect) -> dict:
         """
         Returns the naming convention used by a given SQL dialect.
@@ -7,14 +7,17 @@
 
 # Built-in dependencies
 
+import contextlib
 import sqlite3
 import tempfile
+from typing import BinaryIO
 
 # Package dependencies
 
-from geodatabr.core import encoders
-from geodatabr.core.utils import io
+from geodatabr.core import encoders, i18n
+from geodatabr.dataset import schema
 from geodatabr.encoders import sql
+from geodatabr.encoders.sql import utils as sql_utils
 
 # Classes
 
@@ -74,7 +77,7 @@ class SqliteEncoder(sql.SqlEncoder, encoders.Encoder):
         """Gets the default encoding options."""
         return dict(dialect='sqlite')
 
-    def encode(self, data: dict, **options) -> io.BinaryFileStream:
+    def encode(self, data: dict, **options) -> BinaryIO:
         """
         Encodes the data into a SQLite file-like stream.
 
@@ -88,17 +91,47 @@ class SqliteEncoder(sql.SqlEncoder, encoders.Encoder):
         Raises:
             geodatabr.core.encoders.EncodeError: If data fails to encode
         """
-        try:
-            sql_data = super().encode(data, **dict(self.options, **options))
-
-            with tempfile.NamedTemporaryFile() as sqlite_file:
-                with sqlite3.connect(sqlite_file.name) as sqlite_con:
-                    sqlite_cursor = sqlite_con.cursor()
-                    sqlite_cursor.execute('PRAGMA page_size = 1024')
-                    sqlite_cursor.execute('PRAGMA foreign_keys = ON')
-                    sqlite_cursor.executescript(
-                        'BEGIN; {} COMMIT'.format(sql_data.read().decode()))
+        sqlite_file = None
 
-                return io.BinaryFileStream(sqlite_file.read())
+        try:
+            options = dict(self.options, **options)
+            # Only the DDL statements are compiled, the rows are bound as
+            # native values instead of being rendered and parsed back as SQL
+            tables = [sql_utils.Table(entity.__table__, **options)
+                      for entity in schema.ENTITIES
+                      if data.get(entity.__table__.name)]
+
+            # The database file is handed over as the stream itself, so it's
+            # never loaded into memory; it's removed once the stream is closed
+            sqlite_file = tempfile.NamedTemporaryFile()
+
+            with contextlib.closing(sqlite3.connect(sqlite_file.name)) \
+                    as sqlite_con:
+                sqlite_cursor = sqlite_con.cursor()
+                sqlite_cursor.execute('PRAGMA page_size = 1024')
+                sqlite_cursor.execute('PRAGMA foreign_keys = ON')
+                sqlite_cursor.execute('PRAGMA journal_mode = OFF')
+                sqlite_cursor.execute('PRAGMA synchronous = OFF')
+
+                # Each table is created, filled and only then indexed, so the
+                # indexes aren't updated on every insert
+                for table in tables:
+                    columns = table.table.columns
+                    sqlite_cursor.executescript(table.compileDefinition())
+                    sqlite_cursor.execute('BEGIN')
+                    sqlite_cursor.executemany(
+                        'INSERT INTO {table} VALUES ({values})'.format(
+                            table=i18n._(table.table.name),
+                            values=', '.join(':' + column.name
+                                             for column in columns)),
+                        data.get(table.table.name))
+                    sqlite_cursor.executescript(table.compileIndexes())
+
+                sqlite_con.commit()
+
+            return sqlite_file
         except Exception:
+            if sqlite_file:
+                sqlite_file.close()
+
             raise encoders.EncodeError
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""JSON encoder testing module."""
+# pylint: disable=no-self-use, protected-access
+
+# Imports
+
+# Built-in dependencies
+
+import json
+
+# External dependencies
+
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import types
+from geodatabr.encoders import json as json_encoder
+
+# Constants
+
+DATA = types.OrderedMap(
+    states=[{'id': 11, 'name': 'Rondônia', 'code': 'RO'}],
+    mesoregions=[{'name': 'Madeira-Guaporé', 'state_id': 11, 'id': None}])
+
+COMPACT = dict(indent=None, separators=(',', ':'))
+
+# Functions
+
+
+def dumps(data, **options) -> bytes:
+    """
+    Encodes the data with the stdlib, using the JSON encoder defaults.
+
+    Args:
+        data: The data to encode
+        **options: The encoding options
+
+    Returns:
+        The JSON document
+    """
+    return json.dumps(
+        data, **dict(json_encoder.JsonEncoder().options, **options)) \
+        .encode('utf-8')
+
+# Classes
+
+
+class TestJsonEncoder(object):
+    """Tests JsonEncoder encoding."""
+
+    def testGetOrjsonOption(self):
+        """Tests if JsonEncoder._getOrjsonOption() maps the options."""
+        orjson = pytest.importorskip('orjson')
+        encoder = json_encoder.JsonEncoder()
+
+        def _getOrjsonOption(**options):
+            return encoder._getOrjsonOption(dict(encoder.options, **options))
+
+        assert _getOrjsonOption() == orjson.OPT_INDENT_2
+        assert _getOrjsonOption(**COMPACT) == 0
+        assert _getOrjsonOption(ensure_ascii=True) is None
+        assert _getOrjsonOption(sort_keys=True) is None
+        assert _getOrjsonOption(indent=4) is None
+        assert _getOrjsonOption(indent=None) is None
+
+    @pytest.mark.parametrize('options', [
+        {},
+        COMPACT,
+        dict(ensure_ascii=True),
+        dict(sort_keys=True),
+        dict(COMPACT, sort_keys=True),
+    ])
+    def testEncode(self, options):
+        """Tests if JsonEncoder.encode() matches json.dumps()."""
+        assert json_encoder.JsonEncoder().encode(DATA, **options).getvalue() \
+            == dumps(DATA, **options)
+
+    @pytest.mark.parametrize('options', [{}, COMPACT])
+    @pytest.mark.parametrize('data', [
+        {1: 'one', 2: 'two'},
+        {'id': 2 ** 64},
+        [{'id': -2 ** 63 - 1}],
+    ])
+    def testEncodeFallback(self, data, options):
+        """Tests if JsonEncoder.encode() falls back on unsupported values."""
+        assert json_encoder.JsonEncoder().encode(data, **options).getvalue() \
+            == dumps(data, **options)
+
+    def testHasFloats(self):
+        """Tests if JsonEncoder._hasFloats() finds nested float values."""
+        encoder = json_encoder.JsonEncoder()
+
+        assert not encoder._hasFloats(DATA)
+        assert not encoder._hasFloats([1, 'one', None, True, [], {}])
+        assert encoder._hasFloats(1.5)
+        assert encoder._hasFloats({'states': [{'id': 1, 'area': 0.5}]})
+        assert encoder._hasFloats([[(1, [float('nan')])]])
+
+    @pytest.mark.parametrize('options', [{}, COMPACT])
+    @pytest.mark.parametrize('value', [
+        237765.293,
+        1e16,
+        2.5e-05,
+        float('nan'),
+        float('inf'),
+        -float('inf'),
+    ])
+    def testEncodeFloats(self, value, options):
+        """Tests if JsonEncoder.encode() formats floats as json.dumps()."""
+        data = types.OrderedMap(states=[{'id': 11, 'area': value}])
+
+        assert json_encoder.JsonEncoder().encode(data, **options).getvalue() \
+            == dumps(data, **options)
+
+    def testEncodeToFile(self, tmp_path):
+        """Tests if JsonEncoder.encodeToFile() matches json.dumps()."""
+        json_file = tmp_path / 'brazil.json'
+
+        for options in ({}, dict(ensure_ascii=True)):
+            json_encoder.JsonEncoder().encodeToFile(DATA, json_file, **options)
+
+            assert json_file.read_bytes() == dumps(DATA, **options)
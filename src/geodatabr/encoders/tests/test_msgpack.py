@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""MessagePack encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import msgpack
+import pytest
+
+# Package dependencies
+
+from geodatabr.core import encoders, types
+from geodatabr.encoders import msgpack as msgpack_encoder
+
+# Classes
+
+
+class TestMessagePackEncoder(object):
+    """Tests MessagePackEncoder encoding."""
+
+    def testFormat(self):
+        """Tests if the MessagePack encoder is registered by its format."""
+        encoder = encoders.EncoderFactory.fromFormat('msgpack')
+
+        assert isinstance(encoder, msgpack_encoder.MessagePackEncoder)
+        assert encoder.format.extension == '.msgpack'
+        assert encoder.format.isBinary
+
+    def testEncode(self):
+        """Tests if MessagePackEncoder.encode() round-trips the data."""
+        data = types.OrderedMap(
+            states=[{'id': 11, 'name': 'Rondônia', 'area': None}])
+        msgpack_data = msgpack_encoder.MessagePackEncoder().encode(data)
+        decoded_data = msgpack.unpackb(msgpack_data.getvalue(), raw=False)
+
+        assert decoded_data == data
+        assert list(decoded_data) == list(data)
+
+    def testEncodeBytes(self):
+        """Tests if MessagePackEncoder.encode() keeps bytes apart from str."""
+        msgpack_data = msgpack_encoder.MessagePackEncoder() \
+            .encode({'name': 'name', 'data': b'data'})
+
+        assert msgpack.unpackb(msgpack_data.getvalue(), raw=False) \
+            == {'name': 'name', 'data': b'data'}
+
+    def testEncodeError(self):
+        """Tests if MessagePackEncoder.encode() fails on unsupported data."""
+        with pytest.raises(encoders.EncodeError):
+            msgpack_encoder.MessagePackEncoder().encode({'data': object()})
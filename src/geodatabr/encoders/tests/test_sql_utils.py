@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""SQL encoder utilities testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# External dependencies
+
+import pytest
+from sqlalchemy.sql import schema, sqltypes
+
+# Package dependencies
+
+from geodatabr.encoders.sql import utils as sql_utils
+
+# Constants
+
+COLUMNS = [
+    schema.Column('name', sqltypes.String(64)),
+    schema.Column('description', sqltypes.Text()),
+    schema.Column('label', sqltypes.Unicode(64)),
+]
+
+VALUES = [
+    '',
+    'Rondônia',
+    "Santa Bárbara d'Oeste",
+    "Pau-d''Alho",
+    '100%',
+    '%s',
+    'C:\\Windows',
+    '\\',
+    "it's 100% \\o/",
+]
+
+# Classes
+
+
+class TestCompiler(object):
+    """Tests Compiler methods."""
+
+    @pytest.mark.parametrize('dialect', ['default', 'sqlite', 'mysql'])
+    @pytest.mark.parametrize('column', COLUMNS, ids=str)
+    def testLiteralProcessor(self, dialect, column):
+        """Tests if Compiler.literalProcessor() renders as the dialect."""
+        compiler = sql_utils.Column(column, dialect=dialect)
+        processor = column.type.literal_processor(dialect=compiler.dialect)
+        literal_processor = compiler.literalProcessor(column)
+
+        for value in VALUES:
+            assert literal_processor(value) == processor(value)
+
+    @pytest.mark.parametrize('dialect', ['default', 'sqlite', 'mysql'])
+    def testLiteralProcessorNonString(self, dialect):
+        """Tests if Compiler.literalProcessor() keeps non-string processors."""
+        column = schema.Column('id', sqltypes.Integer())
+        compiler = sql_utils.Column(column, dialect=dialect)
+
+        assert compiler.literalProcessor(column)(42) == '42'
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+# Copyright (c) 2013-2018 Paulo Freitas
+# MIT License (see LICENSE file)
+"""XML encoder testing module."""
+# pylint: disable=no-self-use
+
+# Imports
+
+# Package dependencies
+
+from geodatabr.encoders import xml
+
+# Constants
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="utf-8"?>\n'
+
+# Classes
+
+
+class TestXmlEncoder(object):
+    """Tests XmlEncoder encoding."""
+
+    def testEncode(self):
+        """Tests if XmlEncoder.encode() renders rows and empty tables."""
+        data = {'states': [{'id': '1', 'name': 'A'}], 'mesoregions': []}
+
+        assert xml.XmlEncoder().encode(data).getvalue() == (
+            XML_DECLARATION
+            + b'<brazil>\n'
+            + b'  <states>\n'
+            + b'    <state id="1" name="A"/>\n'
+            + b'  </states>\n'
+            + b'  <mesoregions/>\n'
+            + b'</brazil>\n')
+
+    def testEncodeNotPretty(self):
+        """Tests if XmlEncoder.encode() renders rows without pretty print."""
+        data = {'states': [{'id': '1', 'name': 'A'}], 'mesoregions': []}
+        xml_data = xml.XmlEncoder().encode(data, pretty_print=False)
+
+        assert xml_data.getvalue() == (
+            XML_DECLARATION
+            + b'<brazil><states><state id="1" name="A"/></states>'
+            + b'<mesoregions/></brazil>')
+
+    def testEncodeEmpty(self):
+        """Tests if XmlEncoder.encode() self-closes an empty dataset."""
+        encoder = xml.XmlEncoder()
+
+        assert encoder.encode({}).getvalue() \
+            == XML_DECLARATION + b'<brazil/>\n'
+        assert encoder.encode({}, pretty_print=False).getvalue() \
+            == XML_DECLARATION + b'<brazil/>'
+        assert encoder.encode({}, xml_declaration=False).getvalue() \
+            == b'<brazil/>\n'
@@ -86,7 +86,7 @@ class MicrosoftExcelEncoder(encoders.Encoder):
             xls_data = types.OrderedMap()
 
             for entity, records in data.items():
-                xls_data[entity] = [list(records.first().keys())] \
+                xls_data[entity] = [list(records[0].keys())] \
                     + [list(record.values()) for record in records]
 
             pyexcel_xls.save_data(xls_file, xls_data)
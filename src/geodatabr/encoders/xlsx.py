@@ -86,7 +86,7 @@ class OfficeOpenXmlWorkbookEncoder(encoders.Encoder):
             xlsx_data = types.OrderedMap()
 
             for entity, records in data.items():
-                xlsx_data[entity] = [list(records.first().keys())] \
+                xlsx_data[entity] = [list(records[0].keys())] \
                     + [list(record.values()) for record in records]
 
             pyexcel_xlsx.save_data(xlsx_file, xlsx_data)
@@ -90,24 +90,51 @@ class XmlEncoder(encoders.Encoder):
         """
         # pylint: disable=protected-access
         try:
-            dataset = etree.Element(i18n._('dataset_name'))
+            options = dict(self.options, **options)
+            encoding = options.get('encoding')
+            newline, indent = (('\n', '  ') if options.get('pretty_print')
+                               else ('', ''))
             entities = {i18n._(entity.__table__.name): i18n._(entity._name)
                         for entity in schema.ENTITIES}
+            xml_file = io.BinaryFileStream()
 
-            for table_name, rows in iter(data.items()):
-                table = etree.SubElement(dataset, table_name)
+            if options.get('xml_declaration'):
+                # Written by hand since lxml hard-codes single quoting
+                xml_file.write('<?xml version="1.0" encoding="{}"?>\n'
+                               .format(encoding).encode(encoding))
 
-                for row in rows:
-                    etree.SubElement(table, entities.get(table_name), row)
+            # Streams the elements to the file instead of building the whole
+            # tree in memory, so only the current row element is kept alive
+            with etree.xmlfile(xml_file, encoding=encoding) as xml_writer:
+                write, element = xml_writer.write, etree.Element
+                row_indent = newline + indent * 2
 
-            xml_data = etree.tostring(dataset,
-                                      **dict(self.options, **options))
+                # Empty elements are self-closed, as lxml would render them
+                if not data:
+                    write(element(i18n._('dataset_name')))
+                else:
+                    with xml_writer.element(i18n._('dataset_name')):
+                        for table_name, rows in data.items():
+                            write(newline + indent)
 
-            # Workaround for hard-coded single quoting
-            xml_declaration = xml_data[:xml_data.find(b'?>') + 2]
-            xml_data = xml_data.replace(xml_declaration,
-                                        xml_declaration.replace(b"'", b'"'))
+                            if not rows:
+                                write(element(table_name))
+                                continue
 
-            return io.BinaryFileStream(xml_data)
+                            entity = entities.get(table_name)
+
+                            with xml_writer.element(table_name):
+                                for row in rows:
+                                    write(row_indent)
+                                    write(element(entity, row))
+
+                                write(newline + indent)
+
+                        write(newline)
+
+            xml_file.write(newline.encode(encoding))
+            xml_file.seek(0)
+
+            return xml_file
         except Exception:
             raise encoders.EncodeError
@@ -66,7 +66,8 @@ class YamlEncoder(encoders.Encoder):
     def options(self) -> dict:
         """Gets the default encoding options."""
         return dict(allow_unicode=True,
-                    default_flow_style=False)
+                    default_flow_style=False,
+                    encoding='utf-8')
 
     def encode(self, data: dict, **options) -> io.BinaryFileStream:
         """
@@ -84,9 +85,16 @@ class YamlEncoder(encoders.Encoder):
         """
         try:
             utils.register_representers()
+            yaml_file = io.BinaryFileStream()
 
-            return io.BinaryFileStream(
-                yaml.dump(data, **dict(self.options, **options))
-                .encode('utf-8'))
+            # Emits the encoded output straight into the stream, instead of
+            # building the whole document as a string to encode it afterwards
+            yaml.dump(data,
+                      yaml_file,
+                      Dumper=utils.YAML_DUMPER,
+                      **dict(self.options, **options))
+            yaml_file.seek(0)
+
+            return yaml_file
         except Exception:
             raise encoders.EncodeError
@@ -17,6 +17,12 @@ import yaml
 
 from geodatabr.core import types
 
+# Constants
+
+# Uses the LibYAML based dumper when available, falling back to the pure
+# Python one otherwise
+YAML_DUMPER = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
 # Functions
 
 
@@ -64,8 +70,9 @@ def represent_mapping(dumper: yaml.dumper.BaseDumper,
 
 def register_representers():
     """Registers custom YAML representers."""
-    for dumper in (yaml.Dumper, yaml.SafeDumper):
-        yaml.add_representer(types.List, dumper.represent_list)
+    for dumper in {yaml.Dumper, yaml.SafeDumper, YAML_DUMPER}:
+        yaml.add_representer(types.List, dumper.represent_list, Dumper=dumper)
 
-        for mapping in (collections.OrderedDict, types.Map, types.OrderedMap):
-            yaml.add_representer(mapping, represent_mapping)
+        for mapping in (dict, collections.OrderedDict, types.Map,
+                        types.OrderedMap):
+            yaml.add_representer(mapping, represent_mapping, Dumper=dumper)
@@ -15,8 +15,8 @@ import setuptools
 
 # Compatibility check
 
-if sys.version_info[:2] < (3, 4):
-    raise RuntimeError('Python version >= 3.4 required')
+if sys.version_info[:2] < (3, 7):
+    raise RuntimeError('Python version >= 3.7 required')
 
 # Routines
 
@@ -49,7 +49,7 @@ setuptools.setup(
     },
 
     # Package dependencies
-    python_requires='>=3.4',
+    python_requires='>=3.7',
     install_requires=[
         # geodatabr package
         'pytest',
@@ -62,6 +62,7 @@ setuptools.setup(
         'sqlalchemy',
         # geodatabr.encoders package
         'lxml',
+        'msgpack',
         'pyexcel-ods',
         'pyexcel-xls',
         'pyexcel-xlsx',